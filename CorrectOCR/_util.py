@@ -1,7 +1,12 @@
+import string
+
 import regex
 
 punctuationRE = regex.compile(r'\p{punct}+')
 
+# the ASCII characters matched by punctuationRE, for a regex-free check of ASCII strings
+asciiPunctuation = ''.join(c for c in string.punctuation if punctuationRE.fullmatch(c))
+
 hyphenRE = regex.compile(r'(?:\{Pd}|[\xad\-])+$')
 
 letterRE = regex.compile(r'\p{L}')
@@ -45,9 +45,9 @@ def build_dictionary(workspace: Workspace, config):
 			line = line.strip()
 			if len(line) == 0:
 				pass
-			elif line[0] == '#':
+			elif line.startswith('#'):
 				log.info(line)
-			elif line[:4] == 'http':
+			elif line.startswith('http'):
 				if '\t' in line:
 					(url, filename) = line.split('\t')
 					filename = corpusPath.joinpath(md5(url)).joinpath(Path(filename).name)
@@ -65,7 +65,7 @@ def build_dictionary(workspace: Workspace, config):
 				else:
 					log.error(f'Unable to save file: {r}')
 				time.sleep(random.uniform(0.5, 1.5))
-			elif line[-1] == '/':
+			elif line.endswith('/'):
 				destination = corpusPath.joinpath(md5(line))
 				FileIO.ensure_directories(destination)
 				for file in Path(line).iterdir():
@@ -111,7 +111,7 @@ def build_dictionary(workspace: Workspace, config):
 			log.info(f'Skipping {group}, it is already in dictionary')
 			continue
 		for file in group_path.rglob('*.*'):
-			if file.name[0] == '.' or file.name in ignore:
+			if file.name.startswith('.') or file.name in ignore:
 				continue
 			log.info(f'Getting words from {file.resolve()}')
 			if file.suffix == '.pdf':
@@ -241,10 +241,10 @@ def do_add(workspace: Workspace, config):
 			line = line.strip()
 			if len(line) == 0:
 				pass
-			elif line[0] == '#':
+			elif line.startswith('#'):
 				log.info(line)
 			else:
-				if line[:4] == 'http':
+				if line.startswith('http'):
 					files.append(line) # TODO urllib.parse?
 				else:
 					files.append(Path(line))
@@ -307,7 +307,7 @@ def do_batch(workspace: Workspace, config):
 	elif config.filelist:
 		docids = _open_for_reading(config.filelist).readlines()
 		for i, docid in enumerate(docids):
-			if docid[-1] == '\n':
+			if docid.endswith('\n'):
 				docid = docid[:-1]
 			file = workspace._originalPath / (docid + config.file_type)
 			if not file.is_file():
@@ -403,8 +403,9 @@ def do_stats(workspace: Workspace, config):
 	
 		log.info(f'Saving settings to {workspace.resources.heuristicSettingsFile.name}')
 		for b in bins:
-			binID = b.split()[1]
-			action = b.split()[-1]
+			fields = b.split()
+			binID = fields[1]
+			action = fields[-1]
 			workspace.resources.heuristicSettingsFile.write(binID + u'\t' + action + u'\n')
 
 
@@ -443,10 +444,10 @@ def do_correct(workspace: Workspace, config):
 
 		if metrics:
 			log.info(f'Saving metrics.')
-			for key, count in sorted(metrics['correctionTracking'].items(), key=lambda x: x[1], reverse=True):
-				(original, gold) = key.split('\t')
-				workspace.resources.memoizedCorrections[original] = gold
-				workspace.resources.correctionTracking[f'{original}\t{gold}'] = count
+			tracking = metrics['correctionTracking']
+			workspace.resources.correctionTracking.update(tracking)
+			# keys are 'original\tgold'
+			workspace.resources.memoizedCorrections.update(key.split('\t') for key, count in tracking.most_common())
 			workspace.resources.correctionTracking.save()
 			workspace.resources.memoizedCorrections.save()
 	elif config.gold_ready:
@@ -460,8 +461,6 @@ def do_correct(workspace: Workspace, config):
 		log.critical('This shouldn''t happen!')
 		raise SystemExit(-1)
 
-	corrected = [t for t in corrected if not t.is_discarded]
-
 	log.info(f'Applying corrections to {docid}')
 	Tokenizer.for_type(doc.ext).apply(
 		doc.original_path,
@@ -1,7 +1,8 @@
 import cmd
+import itertools
 import logging
-from collections import deque
-from typing import List, Iterator, TypeVar, Tuple
+from collections import Counter, deque
+from typing import Deque, Iterable, Iterator, TypeVar, Tuple
 
 from .tokens import TokenList
 
@@ -17,11 +18,16 @@ For example:
 
 
 T = TypeVar('T')
-def _split_window(l: List[T], before=3, after=3) -> Iterator[Tuple[List[T], T, List[T]]]:
+def _split_window(l: Iterable[T], before=3, after=3) -> Iterator[Tuple[Deque[T], T, Deque[T]]]:
+	# the contexts are the live buffers, so they are only valid until the next step
+	it = iter(l)
 	a = deque(maxlen=before)
-	for i in range(len(l)):
-		yield list(a), l[i], l[i+1:i+1+after]
-		a.append(l[i])
+	b = deque(itertools.islice(it, after+1)) # current item and the lookahead
+	while b:
+		current = b.popleft()
+		yield a, current, b
+		a.append(current)
+		b.extend(itertools.islice(it, 1))
 
 
 class CorrectionShell(cmd.Cmd):
@@ -30,7 +36,7 @@ class CorrectionShell(cmd.Cmd):
 	tokens are `binned`.
 	"""
 	log = logging.getLogger(f'{__name__}.CorrectionShell')
-	_prompt = 'CorrectOCR> '
+	prompt = 'CorrectOCR> '
 
 	def __init__(self, tokens: TokenList, dictionary, correctionTracking: dict):
 		super().__init__()
@@ -43,10 +49,20 @@ class CorrectionShell(cmd.Cmd):
 			'tokenCount': 0,
 			'humanCount': 0,
 			'tokenTotal': len(tokens),
-			'newWords': [],
-			'correctionTracking': correctionTracking,
+			'newWords': set(),
+			'correctionTracking': Counter(correctionTracking),
 		}
+		self._prompt_template = f'CorrectOCR {{}}/{self.metrics["tokenTotal"]} ({{}}) > '
 		self.use_rawinput = True
+		self._output = [] # pending lines, printed together with the next prompt
+		# heuristic => function of the selection, for applying automatic decisions directly instead of via the command queue
+		self._automatic = {
+			'original': lambda _: self._choose(self.token.original, 'original'),
+			'kbest': lambda selection: self._choose(self.token.kbest[int(selection)].candidate, f'{selection}-best'),
+			'kdict': lambda selection: self._choose(self.token.kbest[int(selection)].candidate, 'k-best from dict'),
+			'memoized': lambda selection: self._choose(selection, 'memoized correction', save=False),
+			'linefeed': lambda _: self._choose('\n', 'linefeed', save=False),
+		}
 
 	@classmethod
 	def start(cls, tokens: TokenList, dictionary, correctionTracking: dict, intro: str = None):
@@ -65,41 +81,57 @@ class CorrectionShell(cmd.Cmd):
 
 	def _nexttoken(self):
 		try:
-			while True:  # do-while loop...
+			while True:  # skip tokens with gold, and apply automatic decisions as we go
 				ctxl, self.token, ctxr = next(self.tokenwindow)
 				self.metrics['tokenCount'] += 1
-				if not self.token.gold:
+				if self.token.gold:
+					continue
+				automatic = self._automatic.get(self.token.heuristic)
+				if automatic is None:
 					break
+				automatic(self.token.selection)
 
 			if self.token.heuristic == 'annotator':
 				self.metrics['humanCount'] += 1 # increment human-effort count
 				
 				left = ' '.join([c.gold or c.original for c in ctxr])
 				right = ' '.join([c.original for c in ctxl])
-				print(f'\n\n...{left} \033[1;7m{self.token.original}\033[0m {right}...\n')
-				print(f'\nSELECT for {self.token.original} :\n')
+				# render the whole display first and print it at once
+				self._output += [
+					f'\n\n...{left} \033[1;7m{self.token.original}\033[0m {right}...\n\n',
+					f'\nSELECT for {self.token.original} :\n\n',
+				]
 				for k, item in self.token.kbest.items():
 					inDict = ' * is in dictionary' if item.candidate in self.dictionary else ''
-					print(f'\t{k}. {item.candidate} ({item.probability:.2e}){inDict}\n')
+					self._output.append(f'\t{k}. {item.candidate} ({item.probability:.2e}){inDict}\n\n')
+				self._flush()
 				
-				self._prompt = f"CorrectOCR {self.metrics['tokenCount']}/{self.metrics['tokenTotal']} ({self.metrics['humanCount']}) > "
+				self.prompt = self._prompt_template.format(self.metrics['tokenCount'], self.metrics['humanCount'])
 			else:
+				self._flush()
 				self.cmdqueue.insert(0, f'{self.token.heuristic} {self.token.selection}')
 		except StopIteration:
-			print('Reached end of tokens, going to quit...')
-			return self.onecmd('quit')
+			self._output.append('Reached end of tokens, going to quit...\n')
+			self._flush()
+			# queued rather than run here, as cmdloop ignores the return value of preloop
+			self.cmdqueue.insert(0, 'quit')
+
+	def _flush(self):
+		print(''.join(self._output), end='')
+		self._output.clear()
 	
 	def _select(self, word: str, heuristic: str, save=True):
-		print(f'Selecting {heuristic} for "{self.token.original}": "{word}"')
+		self._choose(word, heuristic, save)
+		return self._nexttoken()
+
+	def _choose(self, word: str, heuristic: str, save=True):
+		self._output.append(f'Selecting {heuristic} for "{self.token.original}": "{word}"\n')
 		self.token.gold = word
 		if save:
 			if word not in self.dictionary:
-				self.metrics['newWords'].append(word) # add to suggestions for dictionary review
+				self.metrics['newWords'].add(word) # add to suggestions for dictionary review
 			self.dictionary.add(word) # add to current dictionary for subsequent heuristics
-			if f'{self.token.original}\t{word}' not in self.metrics['correctionTracking']:
-				self.metrics['correctionTracking'][f'{self.token.original}\t{word}'] = 0
-			self.metrics['correctionTracking'][f'{self.token.original}\t{word}'] += 1
-		return self._nexttoken()
+			self.metrics['correctionTracking'][f'{self.token.original}\t{word}'] += 1 # Counter defaults to 0
 
 	def emptyline(self):
 		if self.lastcmd == 'original':
@@ -125,7 +157,7 @@ class CorrectionShell(cmd.Cmd):
 
 	def do_kdict(self, arg: str):
 		"""Choose k-best which is in dictionary"""
-		return self._select(self.token.kbest[int(arg)], f'k-best from dict')
+		return self._select(self.token.kbest[int(arg)].candidate, f'k-best from dict')
 
 	def do_memoized(self, arg: str):
 		return self._select(arg, 'memoized correction', save=False)
@@ -1,16 +1,38 @@
+import functools
 import logging
 import itertools
 import string
 from collections import defaultdict
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 
 import progressbar
 
-from ._util import letterRE
 from .fileio import FileIO
 
 
+_strip_chars = string.punctuation + string.whitespace + '»«“”„›‹' # punctuation and quotation marks
+
+
+@functools.lru_cache(maxsize=200_000)
+def _clean(word: str, lower: bool = False) -> str:
+	word = word.replace('\xad', '') # remove soft hyphens
+	word = word.replace('-', '') # remove hard hyphens
+	word = word.strip(_strip_chars) # strip surrounding punctuation and quotation marks
+	if lower:
+		word = word.lower()
+	return word
+
+
+@functools.lru_cache(maxsize=200_000)
+def _lookup_key(word: str, lower: bool) -> Optional[str]:
+	# the form to look up, or None if the word has at most 1 letter and is always "contained"
+	word = _clean(word, lower) # lowercasing doesn't change the letter count
+	if sum(map(str.isalpha, word)) <= 1: # str.isalpha is true for the same characters as \p{L}
+		return None
+	return word
+
+
 class Dictionary(Set[str]):
 	"""
 	Set of words to use for determining correctness of :class:`Tokens<CorrectOCR.tokens.Token>` and suggestions.
@@ -28,6 +50,7 @@ class Dictionary(Set[str]):
 		self.ignoreCase = ignoreCase
 		self._path = path
 		self.groups = defaultdict(set)
+		self._words = set() # union of all groups, for fast lookups
 		self._dirty = set()
 		if self._path:
 			if not self._path.is_dir():
@@ -43,19 +66,12 @@ class Dictionary(Set[str]):
 		return f'<{self.__class__.__name__} "{len(self)}{" ignoreCase" if self.ignoreCase else ""}>'
 
 	def __len__(self) -> int:
-		return len(set().union(*self.groups.values()))
-		#return len([len(group) for group in self.groups.values()])
+		return len(self._words)
 
 	def __contains__(self, word: str) -> bool:
-		word = self.clean(word)
-		if word == '' or len(letterRE.findall(word)) <= 1:
-			return True
-		if self.ignoreCase:
-			word = word.lower()
-		for group in self.groups.values():
-			if word in group:
-				return True
-		return False
+		# only the normalization is memoized, as words may be added at any time
+		key = _lookup_key(word, self.ignoreCase)
+		return key is None or key in self._words
 
 	def has_group(self, group: str) -> bool:
 		return group in self.groups
@@ -64,6 +80,7 @@ class Dictionary(Set[str]):
 		Dictionary.log.info(f'Clearing dictionary at {self._path}.')
 		FileIO.ensure_new_file(self._path) # TODO
 		self.groups = defaultdict(set)
+		self._words = set()
 
 	def add(self, group: str, word: str, nowarn: bool = False, dirty: bool = True):
 		"""
@@ -73,7 +90,7 @@ class Dictionary(Set[str]):
 		:param nowarn: Don't warn about long words (>20 letters).
 		"""
 		word = self.clean(word)
-		if word == '' or not letterRE.search(word):
+		if not any(map(str.isalpha, word)):
 			return
 		if ' ' in word:
 			Dictionary.log.info(f'Splitting word with spaces: {word}')
@@ -87,6 +104,7 @@ class Dictionary(Set[str]):
 			self._dirty.add(group)
 		if len(word) > 20 and not nowarn:
 			Dictionary.log.warning(f'Added word is more than 20 characters long: {word}')
+		self._words.add(word)
 		return self.groups[group].add(word)
 	
 	def save_group(self, group: str):
@@ -112,7 +130,5 @@ class Dictionary(Set[str]):
 				self.save_group(group)
 
 	def clean(self, word: str) -> str:
-		word = word.replace('\xad', '') # remove soft hyphens
-		word = word.replace('-', '') # remove hard hyphens
-		word = word.strip(string.punctuation + string.whitespace + '»«“”„›‹') # strip surrounding punctuation and quotation marks
-		return word
+		# the same words are looked up over and over, so the cleaning is memoized
+		return _clean(word)
@@ -234,9 +234,10 @@ class Document(object):
 				if force or not t.gold:
 					if t.heuristic in {'kbest', 'kdict'}:
 						t.gold = t.kbest[int(t.selection)].candidate
+						tokens_modified = True
 					elif t.heuristic == 'original':
 						t.gold = t.original
-					tokens_modified = True
+						tokens_modified = True
 		
 		if tokens_modified:
 			self.tokens.save()
@@ -255,8 +256,8 @@ class Document(object):
 		else:
 			Document.log.info(f'Generating images for annotation.')
 			count = 0
-			for l, token, r in progressbar.progressbar(list(window(self.tokens))):
-				if ('annotator' in (l.heuristic, token.heuristic, r.heuristic) or l.is_hyphenated) and not token.is_discarded:
+			for l, token, r in progressbar.progressbar(window(self.tokens), max_value=len(self.tokens)):
+				if not token.is_discarded and ('annotator' in (l.heuristic, token.heuristic, r.heuristic) or l.is_hyphenated):
 					_, _ = l.extract_image(self.workspace)
 					_, _ = token.extract_image(self.workspace)
 					_, _ = r.extract_image(self.workspace)
@@ -1,13 +1,19 @@
 import csv
+import functools
 import json
 import logging
 import pickle
 import shutil
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Tuple
 
 from bs4.dammit import UnicodeDammit
 
+try:
+	import orjson
+except ImportError:
+	orjson = None # optional, falls back to json
+
 
 def _open_for_reading(file: Path, binary=False):
 	if binary:
@@ -42,7 +48,8 @@ class FileIO(object):
 			return cls.cachePath('images')
 
 	@classmethod
-	def _csv_header(cls, k: int) -> List[str]:
+	@functools.lru_cache()
+	def _csv_header(cls, k: int) -> Tuple[str, ...]:
 		header = ['Gold', 'Original', 'Hyphenated', 'Discarded']
 		for n in range(1, k+1):
 			header += [f'{n}-best', f'{n}-best prob.']
@@ -50,7 +57,7 @@ class FileIO(object):
 		header += ['Token type', 'Token info', 'Doc ID', 'Index']
 		header += ['Annotation info', 'Has error']
 		cls.log.debug(f'header for k={k}: {header}')
-		return header
+		return tuple(header) # cached, so must not be mutable
 
 	@classmethod
 	def get_encoding(cls, file: Path) -> str:
@@ -122,11 +129,12 @@ class FileIO(object):
 		Saves data into a file. The extension determines the method of saving:
 
 		-  `.pickle` -- uses :mod:`pickle`.
-		-  `.json` -- uses :mod:`json`.
+		-  `.json` -- uses :mod:`orjson` if installed, otherwise :mod:`json`. Written as UTF-8.
 		-  `.csv` -- uses :class:`csv.DictWriter` (assumes data is list of :func:`vars()`-capable
 		   objects). The keys of the first object determines the header.
 
-		Any other extension will simply :func:`write()` the data to the file.
+		Any other extension will simply :func:`write()` the data to the file, or
+		:func:`writelines()` if it is an iterable of strings.
 
 		:param data: The data to save.
 		:param path: The path to save to.
@@ -135,7 +143,7 @@ class FileIO(object):
 		from ._codecs import COCRJSONCodec
 		from .tokens.list import TokenList
 		binary = False
-		if path.suffix == '.pickle':
+		if path.suffix in {'.pickle', '.json'}:
 			binary = True
 		if backup:
 			cls.ensure_new_file(path)
@@ -147,19 +155,29 @@ class FileIO(object):
 			if path.suffix == '.pickle':
 				pickle.dump(data, f)
 			elif path.suffix == '.json':
-				json.dump(data, f, cls=COCRJSONCodec)
+				# encoding in one go and writing once is much faster than json.dump's many small writes
+				if orjson:
+					f.write(orjson.dumps(
+						data,
+						default=COCRJSONCodec().default,
+						option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+					))
+				else:
+					f.write(json.dumps(data, cls=COCRJSONCodec).encode('utf-8'))
 			elif path.suffix == '.csv':
 				if isinstance(data, TokenList):
 					header = cls._csv_header(data[0].k)
-					rows = [vars(x) for x in data]
+					rows = (vars(x) for x in data) # one token at a time, rather than a dict for each up front
 				else:
 					header = data[0].keys()
 					rows = data
 				writer = csv.DictWriter(f, header, delimiter='\t', extrasaction='ignore')
 				writer.writeheader()
 				writer.writerows(rows)
-			else:
+			elif isinstance(data, str):
 				f.write(data)
+			else:
+				f.writelines(data)
 
 	@classmethod
 	def load(cls, path: Path, default=None):
@@ -167,7 +185,8 @@ class FileIO(object):
 		Loads data from a file. The extension determines the method of saving:
 
 		-  `.pickle` -- uses :mod:`pickle`.
-		-  `.json` -- uses :mod:`json`.
+		-  `.json` -- uses :mod:`orjson` if installed and no custom objects are stored, otherwise :mod:`json`.
+		   Read as UTF-8, falling back to :meth:`get_encoding` if the file is not valid UTF-8.
 		-  `.csv` -- uses :class:`csv.DictReader`.
 
 		Any other extension will simply :func:`read()` the data from the file.
@@ -178,7 +197,7 @@ class FileIO(object):
 		"""
 		from ._codecs import COCRJSONCodec
 		binary = False
-		if path.suffix == '.pickle':
+		if path.suffix in {'.pickle', '.json'}:
 			binary = True
 		if not path.is_file():
 			return default
@@ -186,7 +205,18 @@ class FileIO(object):
 			if path.suffix == '.pickle':
 				return pickle.load(f)
 			elif path.suffix == '.json':
-				return json.load(f, object_hook=COCRJSONCodec.object_hook)
+				data = f.read()
+				try:
+					data = data.decode('utf-8') # as written by save()
+				except UnicodeDecodeError:
+					data = data.decode(cls.get_encoding(path)) # eg. edited by hand in another encoding
+				# orjson has no object hook, so only use it when there are no custom objects to decode
+				if orjson and 'COCRkind' not in data:
+					try:
+						return orjson.loads(data)
+					except orjson.JSONDecodeError:
+						pass # eg. NaN written by json, which orjson rejects
+				return json.loads(data, object_hook=COCRJSONCodec.object_hook)
 			elif path.suffix == '.csv':
 				return list(csv.DictReader(f, delimiter='\t'))
 			else:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import logging
 import pprint
 import traceback
 from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass, replace, field
-from typing import Callable, DefaultDict, Dict, List, TYPE_CHECKING
+from typing import Callable, DefaultDict, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import progressbar
 
@@ -25,6 +26,14 @@ _heuristics_map = {
 	'd': 'kdict',
 }
 
+# heuristic => function of (original, filtids) that gives the selection
+_selectors = {
+	'original': lambda original, filtids: original,
+	'kbest': lambda original, filtids: 1,
+	'kdict': lambda original, filtids: filtids[0],
+	'annotator': lambda original, filtids: filtids,
+}
+
 
 class Heuristics(object):
 	log = logging.getLogger(f'{__name__}.Heuristics')
@@ -46,6 +55,11 @@ class Heuristics(object):
 		for (number, _bin) in _bins.items():
 			_bin.number = number
 		Heuristics.log.debug(f'Bins: {_bins}')
+		# _bin_index(...) => (bin number, heuristic, selector), with the selector None if the heuristic is unknown
+		self._decisions = tuple(
+			None if number is None else (number, _bins[number].heuristic, _selectors.get(_bins[number].heuristic))
+			for number in _bin_table
+		)
 		self.dictionary = dictionary
 		self.documents = dict()
 		self.tokenCount = 0
@@ -59,49 +73,47 @@ class Heuristics(object):
 		self.summary = Counter()
 
 	def bin_for_word(self, original, kbest):
+		in_dictionary = self.dictionary.__contains__
+
 		# k best candidates which are in dictionary
-		filtids = [n for n, item in kbest.items() if item.candidate in self.dictionary]
+		filtids = [n for n, item in kbest.items() if in_dictionary(item.candidate)]
 
-		dcode = None
+		# index into _dcodes
 		if len(filtids) == 0:
-			dcode = 'zerokd'
-		elif 0 < len(filtids) < len(kbest):
-			dcode = 'somekd'
-		elif len(filtids) == len(kbest):
-			dcode = 'allkd'
-
-		token_bin = None
-		for num, _bin in _bins.items():
-			if _bin.matcher(original, kbest[1].candidate, self.dictionary, dcode):
-				token_bin = _bin._copy()
-				break
-
-		if token_bin is None:
-			raise ValueError(f'No bin matched for: {token}')
-
-		if token_bin.heuristic == 'original':
-			selection = original
-		elif token_bin.heuristic == 'kbest':
-			selection = 1
-		elif token_bin.heuristic == 'kdict':
-			selection = filtids[0]
-		elif token_bin.heuristic == 'annotator':
-			selection = filtids
+			dcode = 0 # zerokd
+		elif len(filtids) < len(kbest):
+			dcode = 1 # somekd
 		else:
-			raise ValueError(f'Bin {token_bin} has an unknown heuristic: {token_bin.heuristic}')
+			dcode = 2 # allkd
+
+		k1 = kbest[1].candidate
+		decision = self._decisions[_bin_index(original == k1, in_dictionary(original), 1 in filtids, dcode)]
+		if decision is None:
+			raise ValueError(f'No bin matched for: {original}')
+		number, heuristic, selector = decision
+		if selector is None:
+			raise ValueError(f'Bin {_bins[number]} has an unknown heuristic: {heuristic}')
 		
-		return token_bin.heuristic, selection, token_bin
+		return heuristic, selector(original, filtids), _bins[number]._copy()
 
 	def bin_tokens(self, tokens: TokenList, force = False) -> bool:
 		Heuristics.log.info('Running heuristics on tokens to determine annotator workload.')
 		modified_count = 0
 		counts = Counter()
 		annotatorRequired = 0
+		# the bin only depends on the word and its candidates, and OCR text is highly repetitive
+		binned = dict()
 		ts = iter(tokens)
 		for original, gold, token in progressbar.progressbar(tokens.consolidated, max_value=len(tokens)):
 			#Heuristics.log.debug(f'binning {token}')
 			if force or token.bin is None:
-				token.heuristic, token.selection, token.bin = self.bin_for_word(token.original, token.kbest)
+				key = (token.original, tuple((n, item.candidate) for n, item in token.kbest.items()))
+				if key not in binned:
+					binned[key] = self.bin_for_word(token.original, token.kbest)
+				heuristic, selection, token_bin = binned[key]
+				if isinstance(selection, list):
+					selection = list(selection) # don't share the annotator's candidate list between tokens
+				token.heuristic, token.selection, token.bin = heuristic, selection, token_bin._copy()
 				if token.is_hyphenated and token.index+1 <= len(tokens):
 					# ugly...
 					next_token = tokens[token.index+1]
@@ -129,6 +141,7 @@ class Heuristics(object):
 		self.documents[tokens[0].docid] = len(tokens)
 		if rebin:
 			Heuristics.log.info(f'Will rebin {len(tokens)} tokens for comparison.')
+		in_dictionary = self.dictionary.__contains__
 		for original, gold, token in progressbar.progressbar(tokens.consolidated, max_value=len(tokens)):
 			try:
 				self.totalCount += 1
@@ -170,6 +183,10 @@ class Heuristics(object):
 					kbest = token.kbest
 					bin_number = token.bin.number					
 
+				# the candidate strings are needed several times below
+				candidates = [item.candidate for item in kbest.values()]
+				k1 = kbest[1].candidate
+
 				if _bins[bin_number].example is None and len(original) > 3 and letterRE.search(original):
 					_bins[bin_number].example = (original, gold, kbest)
 
@@ -184,13 +201,12 @@ class Heuristics(object):
 				if original == gold:
 					counts['(A) gold == orig'] += 1
 
-				if kbest[1].candidate == gold:
+				if k1 == gold:
 					counts['(B) gold == k1'] += 1
 
-				# lower k best candidate words that pass the dictionary check
-				kbest_filtered = [item.candidate for (k, item) in kbest.items() if item.candidate in self.dictionary and k > 1]
-
-				if gold in kbest_filtered:
+				# gold is a lower k best candidate that passes the dictionary check
+				# (only gold itself needs checking, not every candidate)
+				if gold in candidates[1:] and in_dictionary(gold):
 					counts['(C) gold == lower kbest'] += 1
 
 				if token.heuristic:
@@ -199,9 +215,9 @@ class Heuristics(object):
 				if token.heuristic == 'annotator':
 					if gold == original:
 						counts[f'(E) Annotator accepted the original'] += 1
-					elif gold == kbest[1].candidate:
+					elif gold == k1:
 						counts[f'(E) Annotator chose the top candidate'] += 1
-					elif any([gold == item.candidate for item in kbest.values()]):
+					elif gold in candidates:
 						counts[f'(E) Annotator chose a lower candidate'] += 1
 					elif gold is not None:
 						counts[f'(E) Annotator made a novel correction'] += 1
@@ -291,7 +307,7 @@ class Bin:
 
 	:param o: Original string
 	:param k: *k*-best candidate string
-	:param d: Dictionary
+	:param d: Dictionary, or a set of those of ``o`` and ``k`` that are in the dictionary
 	:param dcode: One of 'zerokd', 'somekd', 'allkd' for whether zero, some, or all other *k*-best candidates are in dictionary
 	"""
 	heuristic: str = 'annotator'
@@ -321,11 +337,11 @@ _bins: Dict[int, Bin] = OrderedDict({
 	),
 	2: Bin(
 		description='k1 == original but they are not in dictionary, and no other kbest is in dictionary either.',
-		matcher=lambda o, k, d, dcode: o == k and o not in d and dcode == 'zerokd',
+		matcher=lambda o, k, d, dcode: o == k and dcode == 'zerokd' and o not in d,
 	),
 	3: Bin(
 		description='k1 == original but they are not in dictionary, but some lower-ranked kbest is.',
-		matcher=lambda o, k, d, dcode: o == k and o not in d and dcode == 'somekd',
+		matcher=lambda o, k, d, dcode: o == k and dcode == 'somekd' and o not in d,
 	),
 	4: Bin(
 		description='k1 != original and is in dictionary while original isn''t.',
@@ -333,11 +349,11 @@ _bins: Dict[int, Bin] = OrderedDict({
 	),
 	5: Bin(
 		description='k1 != original and nothing is in dictionary.',
-		matcher=lambda o, k, d, dcode: o != k and o not in d and dcode == 'zerokd',
+		matcher=lambda o, k, d, dcode: o != k and dcode == 'zerokd' and o not in d,
 	),
 	6: Bin(
 		description='k1 != original and neither are in dictionary, but a lower-ranked candidate is.',
-		matcher=lambda o, k, d, dcode: o != k and k not in d and o not in d and dcode == 'somekd',
+		matcher=lambda o, k, d, dcode: o != k and dcode == 'somekd' and k not in d and o not in d,
 	),
 	7: Bin(
 		description='k1 != original and both are in dictionary.',
@@ -345,14 +361,45 @@ _bins: Dict[int, Bin] = OrderedDict({
 	),
 	8: Bin(
 		description='k1 != original, original is in dictionary and no candidates are in dictionary.',
-		matcher=lambda o, k, d, dcode: o != k and o in d and dcode == 'zerokd',
+		matcher=lambda o, k, d, dcode: o != k and dcode == 'zerokd' and o in d,
 	),
 	9: Bin(
 		description='k1 != original, k1 is not in dictionary but both original and a lower candidate are.',
-		matcher=lambda o, k, d, dcode: o != k and o in d and k not in d and dcode == 'somekd',
+		matcher=lambda o, k, d, dcode: o != k and dcode == 'somekd' and o in d and k not in d,
 	),
 	10: Bin(
 		description='Catch-all bin, matches any remaining tokens. It is recommended to pass this to annotator.',
 		matcher=lambda o, k, d, dcode: True,
 	)
 })
+
+
+_dcodes = ('zerokd', 'somekd', 'allkd')
+
+
+def _bin_index(same: bool, o_known: bool, k_known: bool, dcode: int) -> int:
+	# packs the features into 5 bits, dcode being an index into _dcodes
+	return same << 4 | o_known << 3 | k_known << 2 | dcode
+
+
+def _build_bin_table(bins: Dict[int, Bin]) -> Tuple[Optional[int], ...]:
+	"""
+	The matchers only depend on whether the original and the top candidate are
+	equal, whether each is in the dictionary, and the dcode, so the first
+	matching bin can be found in advance for every combination.
+	"""
+	table = [None] * 32
+	for same, o_known, k_known, dcode in itertools.product((True, False), (True, False), (True, False), range(len(_dcodes))):
+		if same and o_known != k_known:
+			continue # the same word is either in the dictionary or not
+		o, k = 'o', ('o' if same else 'k')
+		d = {word for word, known in ((o, o_known), (k, k_known)) if known}
+		for number, _bin in bins.items():
+			if _bin.matcher(o, k, d, _dcodes[dcode]):
+				table[_bin_index(same, o_known, k_known, dcode)] = number
+				break
+	return tuple(table)
+
+
+# _bin_index(original == k1, original in dictionary, k1 in dictionary, dcode) => bin number
+_bin_table = _build_bin_table(_bins)
@@ -1,10 +1,10 @@
 import itertools
 import logging
-import re
 from collections import defaultdict, Counter
 from pathlib import Path
-from typing import DefaultDict, Dict, List, Optional, Tuple, Sequence
+from typing import DefaultDict, Dict, List, Tuple, Sequence
 
+import numpy as np
 import progressbar
 
 from .kbest import KBestItem
@@ -14,6 +14,20 @@ from ..fileio import FileIO
 from ..tokens import TokenList
 
 
+def _best(scores: np.ndarray, k: int) -> np.ndarray:
+	# indices of the k highest scores, in order, with ties in their original order
+	if len(scores) <= max(k, 500): # sorting everything is faster for short arrays
+		return np.argsort(-scores, kind='stable')[:k]
+	# only sort the scores tied with or above the k-th highest, in their original order
+	kth = scores[np.argpartition(-scores, k - 1)[:k]].min()
+	top = np.flatnonzero(scores >= kth)
+	return top[np.argsort(-scores[top], kind='stable')][:k]
+
+
+# upper bound on the variants tried per multicharacter substitution, as they grow exponentially with its occurrences
+_max_multichar_variants = 64
+
+
 class HMM(object):
 	log = logging.getLogger(f'{__name__}.HMM')
 
@@ -27,6 +41,7 @@ class HMM(object):
 		self._init = defaultdict(float)
 		self._init.update(initial)
 		self.states = self.init.keys()
+		self._arrays = None
 		self.clear_cache()
 
 	@property
@@ -40,6 +55,7 @@ class HMM(object):
 		for outer, d in transition.items():
 			for inner, e in d.items():
 				self._tran[outer][inner] = e
+		self._arrays = None
 		self.clear_cache()
 
 	@property
@@ -53,6 +69,7 @@ class HMM(object):
 		for outer, d in emission.items():
 			for inner, e in d.items():
 				self._emis[outer][inner] = e
+		self._arrays = None
 		self.clear_cache()
 
 	def __init__(self, path: Path, multichars=None, use_cache=True):
@@ -136,56 +153,82 @@ class HMM(object):
 		:param char_seq:
 		:return:
 		"""
-		# delta[t][j] is probability of max probability path to state j
-		# at time t given the observation sequence up to time t.
-		delta: List[Optional[Dict[str, float]]] = [None] * len(char_seq)
-		back_pointers: List[Optional[Dict[str, float]]] = [None] * len(char_seq)
+		states, symbols, log_init, log_tran, log_emis = self._parameter_arrays()
+		emis = log_emis[:, [symbols.get(char, len(symbols)) for char in char_seq]]
 
-		delta[0] = {i: self.init[i] * self.emis[i][char_seq[0]]
-                    for i in self.states}
+		# delta[j] is log-probability of max probability path to state j
+		# at time t given the observation sequence up to time t.
+		delta = log_init + emis[:, 0]
+		# back_pointers[t][j] is the preceding state on that path.
+		back_pointers = np.zeros((len(char_seq), len(states)), dtype=np.int32)
 
 		for t in range(1, len(char_seq)):
-			# (preceding state with max probability, value of max probability)
-			d = {j: max({i: delta[t-1][i] * self.tran[i][j] for i in self.states}.items(),
-                            key=lambda x: x[1]) for j in self.states}
+			# from preceding state i in the rows to state j in the columns
+			scores = delta[:, np.newaxis] + log_tran
+			back_pointers[t] = scores.argmax(axis=0)
+			delta = scores.max(axis=0) + emis[:, t]
 
-			delta[t] = {i: d[i][1] * self.emis[i][char_seq[t]] for i in self.states}
-
-			back_pointers[t] = {i: d[i][0] for i in self.states}
-
-		best_state = max(delta[-1], key=lambda x: delta[-1][x])
+		best_state = int(delta.argmax())
 
 		selected_states = [best_state] * len(char_seq)
 		for t in range(len(char_seq) - 1, 0, -1):
 			best_state = back_pointers[t][best_state]
 			selected_states[t-1] = best_state
 
-		return ''.join(selected_states)
+		return ''.join(states[i] for i in selected_states)
+
+	def _parameter_arrays(self):
+		# The parameters as log-space arrays indexed by state number (and symbol
+		# number for emissions), built on first use after they were set.
+		if self._arrays is None:
+			states = list(self.init)
+			symbols = {s: n for n, s in enumerate({s for e in self.emis.values() for s in e})}
+			init = np.array([self.init[i] for i in states], dtype=float)
+			tran = np.array([[self.tran.get(i, {}).get(j, 0.0) for j in states] for i in states], dtype=float).reshape(len(states), len(states))
+			# the extra last column is for symbols that are never emitted
+			emis = np.zeros((len(states), len(symbols) + 1))
+			for n, i in enumerate(states):
+				for s, e in self.emis.get(i, {}).items():
+					emis[n, symbols[s]] = e
+			with np.errstate(divide='ignore'): # zero probability is -inf
+				self._arrays = (states, symbols, np.log(init), np.log(tran), np.log(emis))
+		return self._arrays
 
 	def _k_best_beam(self, word: str, k: int) -> List[Tuple[str, float]]:
+		states, symbols, log_init, log_tran, log_emis = self._parameter_arrays()
+		if len(states) == 0:
+			return []
+		# emission log-probabilities for each state (rows) and character in the word (columns)
+		emis = log_emis[:, [symbols.get(char, len(symbols)) for char in word]]
+
 		# Single symbol input is just initial * emission.
+		scores = log_init + emis[:, 0]
 		if len(word) == 1:
-			paths = [(i, self.init[i] * self.emis[i][word[0]])
-                            for i in self.states]
-			paths = sorted(paths, key=lambda x: x[1], reverse=True)
+			best = _best(scores, k)
+			paths = best[:, np.newaxis]
+			scores = scores[best]
 		else:
 			# Create the N*N sequences for the first two characters
-			# of the word.
-			paths = [((i, j), (self.init[i] * self.emis[i][word[0]] * self.tran[i][j] * self.emis[j][word[1]]))
-					 for i in self.states for j in self.states]
+			# of the word (from state i in the rows to state j in the columns).
+			temp = (scores[:, np.newaxis] + log_tran + emis[:, 1]).ravel()
+
+			# Keep the k best sequences, in rows filled in as we go.
+			best = _best(temp, k)
+			paths = np.empty((len(best), len(word)), dtype=np.intp)
+			paths[:, 0], paths[:, 1] = np.divmod(best, len(states))
+			scores = temp[best]
 
-			# Keep the k best sequences.
-			paths = sorted(paths, key=lambda x: x[1], reverse=True)[:k]
-			
 			# Continue through the input word, only keeping k sequences at
-			# each time step.
+			# each time step (state j in the rows extends path x in the columns).
 			for t in range(2, len(word)):
-				temp = [(x[0] + (j,), (x[1] * self.tran[x[0][-1]][j] * self.emis[j][word[t]]))
-						for j in self.states for x in paths]
-				paths = sorted(temp, key=lambda x: x[1], reverse=True)[:k]
-				#print(t, len(temp), temp[:5], len(paths), temp[:5])
+				temp = (emis[:, t, np.newaxis] + log_tran.T[:, paths[:, t-1]] + scores).ravel()
+				best = _best(temp, k)
+				j, x = np.divmod(best, len(paths))
+				paths = paths[x]
+				paths[:, t] = j
+				scores = temp[best]
 
-		return [(''.join(seq), prob) for seq, prob in paths[:k]]
+		return [(''.join(states[i] for i in path), float(prob)) for path, prob in zip(paths, np.exp(scores))]
 
 	def __getitem__(self, item_key):
 		word, k = item_key
@@ -220,15 +263,26 @@ class HMM(object):
 		return defaultdict(KBestItem, {i: KBestItem(seq, prob) for (i, (seq, prob)) in enumerate(k_best[:k], 1)})
 
 	@classmethod
-	def _multichar_variants(cls, word: str, original: str, replacements: List[str]):
-		variants = [original] + replacements
+	def _multichar_variants(cls, word: str, original: str, replacements: List[str], limit: int = _max_multichar_variants):
 		variant_words = set()
-		pieces = re.split(original, word)
-
-		# Reassemble the word using original or replacements
-		for x in itertools.product(variants, repeat=word.count(original)):
-			variant_words.add(''.join([elem for pair in itertools.zip_longest(
-				pieces, x, fillvalue='') for elem in pair]))
+		pieces = word.split(original) # a literal substring, not a pattern
+		count = len(pieces) - 1
+		if count == 1 and len(replacements) < limit:
+			# the usual case, where there is nothing to combine
+			return {word}.union(replacement.join(pieces) for replacement in replacements)
+
+		# Reassemble the word using original or replacements, with the fewest
+		# replacements first so the closest variants are kept if there are too many.
+		for n in range(count + 1):
+			for positions in itertools.combinations(range(count), n):
+				for chosen in itertools.product(replacements, repeat=n):
+					x = [original] * count
+					for position, replacement in zip(positions, chosen):
+						x[position] = replacement
+					variant_words.add(''.join([elem for pair in itertools.zip_longest(
+						pieces, x, fillvalue='') for elem in pair]))
+					if len(variant_words) >= limit:
+						return variant_words
 
 		return variant_words
 
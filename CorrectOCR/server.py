@@ -285,11 +285,11 @@ def create_app(workspace: Workspace = None, config: Any = None):
 			if prev_token.is_hyphenated:
 				return redirect(url_for('tokeninfo', doc_id=prev_token.docid, doc_index=prev_token.index))
 		tokendict = vars(g.token)
-		if tokendict['Original'][-1] == '\xad': # soft hyphen
+		if tokendict['Original'].endswith('\xad'): # soft hyphen
 			tokendict['Original'] = tokendict['Original'][:-1] + '-'
 			for k in tokendict['k-best'].keys():
 				tokendict['k-best'][k]['candidate'] = tokendict['k-best'][k]['candidate'].replace('\xad', '-')
-		if tokendict['Gold'] and tokendict['Gold'][-1] == '\xad': # soft hyphen
+		if tokendict['Gold'] and tokendict['Gold'].endswith('\xad'): # soft hyphen
 			tokendict['Gold'] = tokendict['Gold'][:-1] + '-'
 		if g.token.is_hyphenated:
 			# TODO ugly hack so users see he joined token....
@@ -6,6 +6,7 @@ import datetime
 import json
 import logging
 import string
+import sys
 import traceback
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import Any, DefaultDict, List, NamedTuple, Optional, Tuple
 import nltk
 
 from .list import TokenList
-from .._util import punctuationRE
+from .._util import asciiPunctuation, punctuationRE
 from ..fileio import FileIO
 from ..heuristics import Bin
 from ..model.kbest import KBestItem
@@ -69,16 +70,17 @@ class Token(abc.ABC):
 			f'{self.index}.png'
 		) #: Where the image file should be cached. Is not guaranteed to exist, but can be generated via extract_image()
 
-		if self.is_punctuation():
+		self._is_punctuation = Token._punctuation_only(self.original)
+		if self._is_punctuation:
 			#self.__class__.log.debug(f'{self}: is_punctuation')
 			self._gold = self.original
 
 	def __setattr__(self, attr, value):
 		super().__setattr__(attr, value)
-		if attr in ('gold', 'is_hyphenated', 'is_discarded', 'has_error'):
+		if attr in {'gold', 'is_hyphenated', 'is_discarded', 'has_error'}:
 			self.last_modified = datetime.datetime.now()
-		if attr == 'is_discarded' and value is True:
-			self.gold = ''
+			if attr == 'is_discarded' and value is True:
+				self.gold = ''
 
 	def __repr__(self):
 		return f'{self.__class__.__name__}({vars(self)})'
@@ -130,12 +132,20 @@ class Token(abc.ABC):
 	def __hash__(self):
 		return self.original.__hash__()
 
+	@staticmethod
+	def _punctuation_only(s: str) -> bool:
+		if s.isalnum():
+			return False # most tokens are plain words, no need to run the regex
+		if s.isascii():
+			return bool(s) and not s.strip(asciiPunctuation) # the regex needs at least one character
+		return punctuationRE.fullmatch(s) is not None
+
 	def is_punctuation(self) -> bool:
 		"""
-		Is the Token purely punctuation?
+		Is the Token purely punctuation? (Determined once, when the Token is created.)
 		"""
 		#self.__class__.log.debug(f'{self}')
-		return punctuationRE.fullmatch(self.original)
+		return self._is_punctuation
 
 	def is_numeric(self) -> bool:
 		"""
@@ -154,10 +164,8 @@ class Token(abc.ABC):
 			'Discarded': self.is_discarded,
 			'Page': self.page,
 			'Frame': self.frame,
+			'k-best': {k: vars(item) for k, item in self.kbest.items()},
 		}
-		output['k-best'] = dict()
-		for k, item in self.kbest.items():
-			output['k-best'][k] = vars(item)
 		if self.bin:
 			output['Bin'] = self.bin.number
 		#else:
@@ -200,7 +208,8 @@ class Token(abc.ABC):
 			if 'k-best' in d:
 				kbest = collections.defaultdict(KBestItem)
 				for k, b in d['k-best'].items():
-					kbest[k] = KBestItem(b['candidate'], b['probability'])
+					# the same candidates recur across many tokens, so share a single copy of each
+					kbest[k] = KBestItem(sys.intern(b['candidate']), b['probability'])
 				t.kbest = kbest
 			if 'Bin' in d and d['Bin'] not in (None, '', '-1', -1):
 				from ..heuristics import Heuristics
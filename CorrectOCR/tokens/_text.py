@@ -6,6 +6,9 @@ from ._super import Token, Tokenizer
 from ..workspace import CorpusFile
 
 
+_NEWLINE_N = '_NEWLINE_N_' #: Marker for line breaks in corpus text.
+
+
 @Token.register
 class StringToken(Token):
 	log = logging.getLogger(f'{__name__}.StringToken')
@@ -46,11 +49,24 @@ class StringTokenizer(Tokenizer):
 
 	@staticmethod
 	def apply(original: CorpusFile, tokens, outfile: CorpusFile, config):
-		spaced = str.join(' ', [token.gold or token.original for token in tokens if not token.is_discarded])
-		despaced = spaced.replace('_NEWLINE_N_', '\n').replace(' \n ', '\n')
+		# single pass: words are separated by spaces, except around line breaks (markers or linefeed corrections)
+		parts = []
+		after_newline = True
+		for token in tokens:
+			if token.is_discarded:
+				continue
+			word = token.gold or token.original
+			if word == _NEWLINE_N or word == '\n':
+				parts.append('\n')
+				after_newline = True
+			else:
+				if not after_newline:
+					parts.append(' ')
+				parts.append(word)
+				after_newline = False
 
 		outfile.header = original.header.replace(u'Corrected: No', u'Corrected: Yes') 
-		outfile.body = despaced
+		outfile.body = str.join('', parts)
 		outfile.save()
 
 	@staticmethod
@@ -11,6 +11,11 @@ import progressbar
 from ..._util import hyphenRE
 
 
+# last characters of any string that hyphenRE can match, for skipping the regex
+# (the '}' is for its literal '{Pd}', and '$' may match before a final newline)
+_hyphen_endings = ('-', '\xad', '}', '\n')
+
+
 class DummyToken(NamedTuple):
 	original: str
 	gold: str
@@ -65,18 +70,16 @@ class TokenList(collections.abc.MutableSequence):
 		TokenList.log.debug(f'init: {self.config} {self.docid}')
 
 	def __str__(self):
-		output = []
-		ts = iter(self)
-		for t in ts:
-			#TokenList.log.debug(f't: {t}')
-			output.append(t.gold or t.original)
-			#TokenList.log.debug(f'output: {output}')
-			if t.is_hyphenated:
-				n = next(ts, DummyToken.hyphen())
-				#TokenList.log.debug(f'n: {n}')
-				output[-1] = output[-1][:-1] + (n.gold or n.original)
-				#TokenList.log.debug(f'output: {output}')
-		return str.join(' ', output)
+		def strings():
+			ts = iter(self)
+			for t in ts:
+				s = t.gold or t.original
+				if t.is_hyphenated:
+					# merge with the next token, dropping the hyphen
+					n = next(ts, DummyToken.hyphen())
+					s = s[:-1] + (n.gold or n.original)
+				yield s
+		return str.join(' ', strings())
 
 	def __len__(self):
 		return len(self.tokens)
@@ -231,7 +234,7 @@ class TokenList(collections.abc.MutableSequence):
 		count = 0
 		tokens = iter(self)
 		for token in progressbar.progressbar(tokens, max_value=len(self.tokens)):
-			if hyphenRE.search(token.original):
+			if token.original.endswith(_hyphen_endings) and hyphenRE.search(token.original):
 				try:
 					token.is_hyphenated = True
 					next(tokens).gold = ''
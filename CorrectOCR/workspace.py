@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import re
 import urllib
@@ -13,7 +14,7 @@ import requests
 from ._cache import LRUCache, cached
 from .dictionary import Dictionary
 from .document import Document
-from .fileio import FileIO
+from .fileio import _open_for_reading, FileIO
 from .heuristics import Heuristics
 from .model.hmm import HMM
 from .tokens.list import TokenList
@@ -188,24 +189,23 @@ class CorpusFile(object):
 		self.path = path
 		self.nheaderlines = nheaderlines
 		if self.path.is_file():
-			lines = FileIO.load(self.path).split('\n')
-			(self.header, self.body) = (
-				str.join('', lines[:self.nheaderlines-1]),
-				str.join('', lines[nheaderlines:])
-			)
+			with _open_for_reading(self.path) as f:
+				# only the header is read line by line, the body is left as is
+				self.header = str.join('', itertools.islice(f, self.nheaderlines))
+				self.body = f.read()
 		else:
 			(self.header, self.body) = ('', '')
 
 	def save(self):
 		"""
-		Concatenate header and body and save.
+		Save header and body, without concatenating them first.
 		"""
 		if not self.header or self.header.strip() == '':
 			self.header = ''
-		elif self.header[-1] != '\n':
+		elif not self.header.endswith('\n'):
 			self.header += '\n'
 		CorpusFile.log.info(f'Saving file to {self.path}')
-		FileIO.save(self.header + self.body, self.path)
+		FileIO.save((self.header, self.body), self.path)
 
 	def is_file(self) -> bool:
 		"""
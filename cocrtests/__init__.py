@@ -18,7 +18,9 @@ logging.disable(logging.WARN)
 logging.debug(f'If this text is visible, debug logging is active. Change it in {__file__}')
 
 from .aligner import *
+from .correcter import *
 from .dictionary import *
+from .fileio import *
 from .heuristics import *
 from .hyphenation import *
 from .last_modified import *
@@ -26,6 +28,7 @@ from .model import *
 from .pdf import *
 from .server import *
 from .token import *
+from .workspace import *
 
 
 import pathlib
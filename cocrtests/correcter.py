@@ -0,0 +1,56 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from .mocks import *
+
+from CorrectOCR.correcter import CorrectionShell, _split_window
+from CorrectOCR.model.kbest import KBestItem
+from CorrectOCR.tokens import Tokenizer
+
+
+class TestCorrecter(unittest.TestCase):
+	def test_split_window(self):
+		windows = [(list(l), c, list(r)) for l, c, r in _split_window(iter(range(5)), before=2, after=2)]
+
+		self.assertEqual(windows, [
+			([], 0, [1, 2]),
+			([0], 1, [2, 3]),
+			([0, 1], 2, [3, 4]),
+			([1, 2], 3, [4]),
+			([2, 3], 4, []),
+		], f'Windows should slide over the items.')
+
+	def test_automatic_decisions(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		f = MockCorpusFile('Strng word')
+		tokens = t.tokenize(f, MockConfig())
+		tokens[0].kbest = {
+			1: KBestItem("String", 1.0),
+		}
+		tokens[0].heuristic, tokens[0].selection = 'kbest', 1
+		tokens[1].heuristic, tokens[1].selection = 'original', 'word'
+
+		output = io.StringIO()
+		# the shell should quit by itself, so any attempt to read input is a failure
+		with contextlib.redirect_stdout(output), mock.patch('builtins.input', side_effect=AssertionError('Shell asked for input')):
+			metrics = CorrectionShell.start(tokens, set(), {})
+
+		self.assertEqual([token.gold for token in tokens], ['String', 'word'], f'Automatic decisions should be applied.')
+		self.assertEqual(metrics['correctionTracking'], {'Strng\tString': 1, 'word\tword': 1}, f'Corrections should be tracked.')
+		self.assertEqual(output.getvalue().count('Selecting'), 2, f'Each decision should be reported: {output.getvalue()}')
+
+	def test_prompt(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		f = MockCorpusFile('Strng word')
+		tokens = t.tokenize(f, MockConfig())
+		tokens[0].heuristic, tokens[0].selection = 'annotator', []
+
+		sh = CorrectionShell(tokens, set(), {})
+		with contextlib.redirect_stdout(io.StringIO()):
+			sh._nexttoken()
+
+		self.assertEqual(sh.prompt, 'CorrectOCR 1/2 (1) > ', f'The prompt shown by cmd should count the tokens.')
@@ -65,3 +65,11 @@ class TestDictionary(unittest.TestCase):
 		
 		for w in words_notok:
 			self.assertFalse(w in d, f'{d} should NOT contain "{w}"')
+
+	def test_ignore_case(self):
+		d = Dictionary(ignoreCase=True)
+
+		d.add(None, 'Word')
+
+		for w in ['word', 'WORD', '»Word«']:
+			self.assertTrue(w in d, f'{d} should contain "{w}"')
@@ -0,0 +1,26 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from .mocks import *
+
+from CorrectOCR.fileio import FileIO
+
+
+class TestFileIO(unittest.TestCase):
+	def test_json_non_ascii(self):
+		# long enough that encoding detection would only see part of a multibyte character
+		data = {'xy': 'æ' * 300000, 'æble\tæble': 1}
+
+		with tempfile.TemporaryDirectory() as tmpdir:
+			path = Path(tmpdir).joinpath('data.json')
+			FileIO.save(data, path, backup=False)
+
+			self.assertEqual(FileIO.load(path), data, f'Non-ASCII JSON should survive a round trip.')
+
+	def test_json_other_encoding(self):
+		with tempfile.TemporaryDirectory() as tmpdir:
+			path = Path(tmpdir).joinpath('data.json')
+			path.write_bytes('{"æble": "æble"}'.encode('latin-1'))
+
+			self.assertEqual(FileIO.load(path), {'æble': 'æble'}, f'JSON in another encoding should still load.')
@@ -2,12 +2,20 @@ import unittest
 
 from .mocks import *
 
-from CorrectOCR.heuristics import Heuristics
+from CorrectOCR.heuristics import Heuristics, _bins
 from CorrectOCR.model.kbest import KBestItem
 from CorrectOCR.tokens import Tokenizer
 
 
 class TestHeuristics(unittest.TestCase):
+	def setUp(self):
+		# Heuristics applies its settings to the shared bins, so restore them after each test
+		heuristics = {number: _bin.heuristic for number, _bin in _bins.items()}
+		def restore():
+			for number, heuristic in heuristics.items():
+				_bins[number].heuristic = heuristic
+		self.addCleanup(restore)
+
 	def test_auto_dehyphenation(self):
 		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
 
@@ -30,3 +38,50 @@ class TestHeuristics(unittest.TestCase):
 		heuristics.bin_tokens(tokens)
 
 		self.assertEqual(token.bin.number, 1, f'Token should be in bin 1.')
+
+	def test_repeated_words(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		f = MockCorpusFile('String String')
+		tokens = t.tokenize(f, MockConfig())
+		for token in tokens:
+			token.kbest = {
+				1: KBestItem("String", 1.0),
+			}
+
+		dictionary = set(["String"])
+		settings = {
+			1: "o",
+		}
+		heuristics = Heuristics(settings, dictionary)
+
+		heuristics.bin_tokens(tokens)
+
+		self.assertEqual([token.bin.number for token in tokens], [1, 1], f'Both tokens should be in bin 1.')
+		self.assertIsNot(tokens[0].bin, tokens[1].bin, f'Tokens should not share a bin instance.')
+
+		heuristics = Heuristics({number: 'a' for number in range(1, 10)}, dictionary)
+		heuristics.bin_tokens(tokens, force=True)
+
+		self.assertEqual([token.selection for token in tokens], [[1], [1]], f'Both tokens should get the annotator selection.')
+		self.assertIsNot(tokens[0].selection, tokens[1].selection, f'Tokens should not share a selection list.')
+
+	def test_bin_for_word(self):
+		dictionary = set(["String", "Strong"])
+		heuristics = Heuristics({}, dictionary)
+
+		cases = [
+			('String', ['String', 'Strung'], 1),
+			('Strixg', ['Strixg', 'Strung'], 2),
+			('Strixg', ['Strixg', 'Strong'], 3),
+			('Strixg', ['String', 'Strung'], 4),
+			('Strixg', ['Strung', 'Strang'], 5),
+			('Strixg', ['Strung', 'Strong'], 6),
+			('String', ['Strong', 'Strung'], 7),
+			('String', ['Strung', 'Strang'], 8),
+			('String', ['Strung', 'Strong'], 9),
+		]
+		for original, candidates, expected in cases:
+			kbest = {n: KBestItem(c, 1.0) for n, c in enumerate(candidates, 1)}
+			heuristic, selection, token_bin = heuristics.bin_for_word(original, kbest)
+			self.assertEqual(token_bin.number, expected, f'{original} with {candidates} should be in bin {expected}.')
@@ -7,10 +7,14 @@ from CorrectOCR.tokens._text import StringToken
 class MockCorpusFile(object):
 	def __init__(self, body, docid='file'):
 		self.docid = docid
+		self.header = ''
 		self.body = body
 		self.path = pathlib.Path(f'{self.docid}.txt')
 		self.id = self.path.stem
 
+	def save(self):
+		pass
+
 
 class MockLang(object):
 	def __init__(self, s):
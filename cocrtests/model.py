@@ -38,6 +38,10 @@ class TestModel(unittest.TestCase):
 		self.assertEqual(kbest[1].candidate, 'String', f'The first candidate should be "String": {kbest}')
 
 
+	def test_viterbi(self):
+		self.assertEqual(self.hmm.viterbi('Slring'), 'String', f'The most probable path should be "String".')
+
+
 	def test_kbest_hyphenated(self):
 		kbest = self.hmm.kbest_for_word('Str-ing', 4)
 		self.assertEqual(kbest[1].candidate, 'Str-ing', f'The first candidate should be "Str-ing": {kbest}')
@@ -62,4 +66,41 @@ class TestModel(unittest.TestCase):
 		self.assertEqual(kbest[1].candidate, 'Stræng', f'The first candidate should be "Stræng": {kbest}')
 		
 		# reset to avoid touching other tests
-		self.hmm.multichars = None
\ No newline at end of file
+		self.hmm.multichars = None
+
+
+	def test_multichar_variants_limit(self):
+		variants = HMM._multichar_variants('cecece', 'ce', ['æ'], limit=4)
+		self.assertEqual(variants, {'cecece', 'æcece', 'ceæce', 'ceceæ'}, f'The variants with the fewest replacements should be kept: {variants}')
+
+
+	def test_kbest_reference(self):
+		# a fixed model with explicit state order, so the result does not
+		# depend on the order the builder's sets happen to come out in
+		hmm = HMM(None, None, use_cache=False)
+		hmm.init = {'a': 0.5, 'b': 0.3, 'c': 0.2}
+		hmm.tran = {
+			'a': {'a': 0.1, 'b': 0.6, 'c': 0.3},
+			'b': {'a': 0.4, 'b': 0.2, 'c': 0.4},
+			'c': {'a': 0.5, 'b': 0.3, 'c': 0.2},
+		}
+		hmm.emis = {
+			'a': {'a': 0.7, 'b': 0.2, 'c': 0.1},
+			'b': {'a': 0.1, 'b': 0.8, 'c': 0.1},
+			'c': {'a': 0.3, 'b': 0.1, 'c': 0.6},
+		}
+
+		# as computed by the original product-space search
+		reference = {
+			'a': [('a', 0.35), ('c', 0.06), ('b', 0.03)],
+			'ab': [('ab', 0.168), ('cb', 0.0144), ('ac', 0.0105), ('aa', 0.007)],
+			'abc': [('abc', 0.04032), ('aba', 0.00672), ('cbc', 0.003456), ('abb', 0.00336)],
+			'bbca': [('abca', 0.004032), ('bbca', 0.0032256), ('baca', 0.0012096), ('abcc', 0.0006912)],
+			'acbca': [('acbca', 0.00127008), ('acaca', 0.0003969), ('abbca', 0.00028224), ('acbcc', 0.000217728)],
+		}
+
+		for word, expected in reference.items():
+			kbest = [(item.candidate, item.probability) for item in hmm.kbest_for_word(word, 4).values()]
+			self.assertEqual([c for c, _ in kbest], [c for c, _ in expected], f'The candidates for "{word}" should match the reference: {kbest}')
+			for (candidate, probability), (_, expected_probability) in zip(kbest, expected):
+				self.assertAlmostEqual(probability, expected_probability, delta=expected_probability*1e-9, msg=f'The probability of "{candidate}" should match the reference')
@@ -13,3 +13,36 @@ class TestToken(unittest.TestCase):
 		tokens = t.tokenize(f, MockConfig())
 
 		self.assertEqual(len(tokens), 1, f'There should be 1 token.')
+
+	def test_is_punctuation(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		for word, expected in (('.', True), ('...', True), ('»—«', True), ('ord,', False), ('1.2', False), ('+', False), ('»ord«', False)):
+			f = MockCorpusFile(word)
+			token = t.tokenize(f, MockConfig())[0]
+			self.assertEqual(bool(token.is_punctuation()), expected, f'Token {word!r} should{"" if expected else " not"} be punctuation.')
+
+		# eg. hOCR words that are only whitespace
+		token = StringToken('', 'doc', 0)
+		self.assertFalse(token.is_punctuation(), f'An empty token should not be punctuation.')
+
+	def test_apply(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		f = MockCorpusFile('Once upen _NEWLINE_N_ a time')
+		tokens = t.tokenize(f, MockConfig())
+		tokens[1].gold = 'upon'
+
+		out = MockCorpusFile('')
+		t.apply(f, tokens, out, MockConfig())
+
+		self.assertEqual(out.body, 'Once upon\na time', f'Line break markers should become newlines without surrounding spaces.')
+
+		f = MockCorpusFile('a b c')
+		tokens = t.tokenize(f, MockConfig())
+		tokens[1].gold = '\n'
+
+		out = MockCorpusFile('')
+		t.apply(f, tokens, out, MockConfig())
+
+		self.assertEqual(out.body, 'a\nc', f'Linefeed corrections should become newlines without surrounding spaces.')
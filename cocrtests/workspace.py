@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from .mocks import *
+
+from CorrectOCR.workspace import CorpusFile
+
+
+class TestCorpusFile(unittest.TestCase):
+	text = 'Title: Test\nCorrected: No\nOnce upon\na time\n'
+
+	def test_header_and_body(self):
+		for nheaderlines, header, body in (
+			(0, '', self.text),
+			(2, 'Title: Test\nCorrected: No\n', 'Once upon\na time\n'),
+		):
+			with tempfile.TemporaryDirectory() as tmpdir:
+				path = Path(tmpdir).joinpath('doc.txt')
+				path.write_text(self.text, encoding='utf-8')
+
+				f = CorpusFile(path, nheaderlines)
+				self.assertEqual(f.header, header, f'Header should be the first {nheaderlines} lines.')
+				self.assertEqual(f.body, body, f'Body should be the remaining lines, with line breaks.')
+
+				f.save()
+				self.assertEqual(path.read_text(encoding='utf-8'), self.text, f'Saving should write the file back unchanged.')
+
+				f = CorpusFile(path, nheaderlines)
+				self.assertEqual((f.header, f.body), (header, body), f'Reloading should give the same header and body.')
+
+	def test_tokenize(self):
+		t = Tokenizer.for_type('.txt')(language=MockLang('english'))
+
+		with tempfile.TemporaryDirectory() as tmpdir:
+			path = Path(tmpdir).joinpath('doc.txt')
+			path.write_text(self.text, encoding='utf-8')
+
+			tokens = t.tokenize(CorpusFile(path, 2), MockConfig())
+
+		self.assertEqual([token.original for token in tokens], ['Once', 'upon', 'a', 'time'], f'Words on either side of a line break should be separate tokens.')